@@ -20,24 +20,93 @@ Usage:
     python extract_columbus.py --year 2023 --quarter 2
     python extract_columbus.py --year 2023 --quarter 1 --skip-text
     python extract_columbus.py --year 2024 --quarter 4 --votes-only
+    python extract_columbus.py --year 2023 --quarter 2 --refresh
+    CHROMIUM_NO_SANDBOX=1 python extract_columbus.py --year 2023 --quarter 2  # as root in a container
 
 Requirements:
     pip install requests playwright
     playwright install chromium
+    pip install orjson  # optional, faster JSON parsing of API responses
 """
 
 import argparse
+import asyncio
 import requests
 import csv
+import hashlib
+import json
+import operator
+import os
+import re
+import shelve
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from datetime import date, timedelta
 from pathlib import Path
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 BASE_URL = "https://webapi.legistar.com/v1/columbus"
 LEGISTAR_WEB = "https://columbus.legistar.com"
 
+# Concurrent API requests in flight, sharing one request-rate budget
+MAX_WORKERS = 16
+REQUESTS_PER_SECOND = 20
+
+# Legistar web pages (columbus.legistar.com), loaded by every Playwright tab,
+# share their own much lower budget
+WEB_REQUESTS_PER_SECOND = 2
+
+# Keep-alive connections held by the HTTP adapter (must cover MAX_WORKERS)
+POOL_SIZE = 32
+
+# API responses are cached on disk for re-runs. Data for a meeting (items, roll
+# calls, votes) is kept for CACHE_TTL once the meeting is SETTLE_DAYS old; the
+# events list and matters once the whole quarter is. Until then - e.g. for the
+# quarter in progress - responses are only reused for RECENT_CACHE_TTL.
+CACHE_TTL = 30 * 86400
+RECENT_CACHE_TTL = 3600
+SETTLE_DAYS = 7
+# Most recent responses also kept in memory, ahead of the on-disk cache
+HOT_CACHE_SIZE = 4096
+
+# Browser tabs used in parallel for Phase 2 scraping (one shared context)
+SCRAPE_PAGES = 8
+
+# Newly scraped texts between flushes of the full-text cache to disk
+TEXT_CACHE_SYNC_EVERY = 25
+
+# Resource types aborted in Phase 2; only the HTML document and its scripts are needed
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media", "other"})
+
+# Write buffer for the Votes CSVs, which can reach tens of MB with full text
+CSV_BUFFER_SIZE = 1 << 20
+
+# Headless Chromium flags that skip GPU, extensions and background services
+CHROMIUM_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--no-first-run',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+]
+
+# Chromium's sandbox can't start as root inside a container; set CHROMIUM_NO_SANDBOX=1
+# only for such runs, since Phase 2 loads third-party pages
+if os.environ.get('CHROMIUM_NO_SANDBOX'):
+    CHROMIUM_ARGS += ['--no-sandbox', '--disable-setuid-sandbox']
+
 
 def get_quarter_dates(year: int, quarter: int) -> tuple:
     """
@@ -63,9 +132,68 @@ def get_output_paths(output_dir: Path, year: int, quarter: int) -> dict:
         'votes': output_dir / f"{prefix}-Votes.csv",
         'voted_items': output_dir / f"{prefix}-Voted-Items.csv",
         'persons': output_dir / f"{prefix}-Persons.csv",
+        'api_cache': output_dir / f".legistar_cache-{year}-Q{quarter}",
+        'text_cache': output_dir / f".fulltext_cache-{year}-Q{quarter}",
     }
 
 
+ABSENT_VALUES = frozenset({'Absent', 'Absent@vote'})
+
+
+def _assign_votes(item: dict, members: tuple, vote_map_get, absent=ABSENT_VALUES) -> list:
+    """
+    Assign vote values based on per-item votes or attendance fallback.
+    Returns one value per member, in `members` order.
+    """
+    attendance = item['attendance']
+    item_votes = item.get('item_votes')
+    if item_votes:
+        # Use actual per-item roll call votes
+        return [
+            vote_map_get(item_votes[m], item_votes[m]) if m in item_votes
+            else ('Absent' if attendance.get(m) in absent else '')
+            for m in members
+        ]
+    if item.get('passed') == 1:
+        # Consent/voice vote - infer from attendance
+        return ['Absent' if attendance.get(m) in absent else 'Yes' for m in members]
+    return [''] * len(members)
+
+
+class MatterRec:
+    """Matter details + attachments fetched for one matter id."""
+
+    __slots__ = ('details', 'attachments')
+
+    def __init__(self, details, attachments):
+        self.details = details
+        self.attachments = attachments
+
+
+class RateLimiter:
+    """Thread-safe token bucket: bursts up to `rate` requests, refills `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.capacity = rate
+        self.tokens = rate
+        self.refill_per_sec = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_per_sec
+            time.sleep(wait)
+
+
 class ColumbusExtractionWorkflow:
     """Complete Columbus City Council data extraction workflow."""
 
@@ -75,15 +203,18 @@ class ColumbusExtractionWorkflow:
         quarter: int,
         skip_text: bool = False,
         votes_only: bool = False,
-        output_dir: Path = None
+        output_dir: Path = None,
+        refresh: bool = False
     ):
         self.year = year
         self.quarter = quarter
         self.skip_text = skip_text
         self.votes_only = votes_only
+        self.refresh = refresh
 
         # Calculate date range
         self.start_date, self.end_date = get_quarter_dates(year, quarter)
+        self.quarter_ttl = self._ttl_for(self.end_date)
 
         # Set output directory
         self.output_dir = output_dir or Path(__file__).parent
@@ -91,38 +222,93 @@ class ColumbusExtractionWorkflow:
 
         # Initialize session with retry logic
         self.session = self._create_session()
+        self.pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self.limiter = RateLimiter(REQUESTS_PER_SECOND)
+        self.web_limiter = RateLimiter(WEB_REQUESTS_PER_SECOND)
+
+        # Persistent API response cache (bypassed for reads with --refresh)
+        self.cache = shelve.open(str(self.output_paths['api_cache']))
+        self.hot_cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+        # Scraped legislative text by matter file (only touched from the main thread)
+        self.text_cache = shelve.open(str(self.output_paths['text_cache']))
 
         # Runtime state
-        self.all_members = set()
+        self.all_members = frozenset()
         self.attendance_by_meeting = {}
         self.meeting_links = {}
         self.matter_cache = {}
+        self.matter_futures = {}
 
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry logic."""
+        """Create requests session with retry logic and a pool sized for the workers."""
         session = requests.Session()
         retry = Retry(
             total=5,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            pool_block=False
+        )
         session.mount('http://', adapter)
         session.mount('https://', adapter)
         return session
 
-    def _api_get(self, url, params=None):
-        """Make API request with rate limiting."""
-        time.sleep(0.25)
+    @staticmethod
+    def _cache_key(url, params=None) -> str:
+        """Stable cache key for a URL + query params."""
+        return hashlib.sha1(f"{url}|{sorted((params or {}).items())}".encode()).hexdigest()
+
+    def _remember(self, key: str, data):
+        """Add a response to the in-memory LRU (caller holds cache_lock)."""
+        self.hot_cache[key] = data
+        self.hot_cache.move_to_end(key)
+        if len(self.hot_cache) > HOT_CACHE_SIZE:
+            self.hot_cache.popitem(last=False)
+
+    @staticmethod
+    def _ttl_for(day: str) -> int:
+        """Cache TTL for data about a meeting or period ending on day ('YYYY-MM-DD...')."""
+        settled = date.fromisoformat(day[:10]) + timedelta(days=SETTLE_DAYS) <= date.today()
+        return CACHE_TTL if settled else RECENT_CACHE_TTL
+
+    def _api_get(self, url, params=None, ttl=CACHE_TTL):
+        """Make API request with rate limiting (safe to call from pool workers)."""
+        key = self._cache_key(url, params)
+        with self.cache_lock:
+            if key in self.hot_cache:
+                self.hot_cache.move_to_end(key)
+                return self.hot_cache[key]
+            entry = self.cache.get(key)
+            if entry and not self.refresh and time.time() - entry[0] < ttl:
+                self._remember(key, entry[1])
+                return entry[1]
+
+        self.limiter.acquire()
         try:
             response = self.session.get(url, params=params, timeout=30)
             if response.status_code == 200:
-                return response.json()
-            return None
+                if not response.content:
+                    return None
+                data = json_loads(response.content)
+                with self.cache_lock:
+                    self.cache[key] = (time.time(), data)
+                    self._remember(key, data)
+                return data
         except Exception as e:
             print(f"  Error fetching {url}: {e}")
             time.sleep(2)
-            return None
+
+        # Fetch failed: an expired (or --refresh bypassed) copy beats no data
+        if entry:
+            print(f"  Using cached copy of {url}")
+            return entry[1]
+        return None
 
     def fetch_persons(self) -> dict:
         """Get all persons (council members, staff) - one bulk call."""
@@ -145,37 +331,49 @@ class ColumbusExtractionWorkflow:
             "$filter": f"EventBodyId eq 27 and EventDate ge datetime'{self.start_date}' and EventDate lt datetime'{self.end_date}'",
             "$orderby": "EventDate asc"
         }
-        meetings = self._api_get(url, params) or []
+        meetings = self._api_get(url, params, ttl=self.quarter_ttl) or []
         print(f"Found {len(meetings)} meetings")
         return meetings
 
-    def fetch_event_items(self, event_id: int) -> list:
+    def fetch_event_items(self, event_id: int, ttl: int = CACHE_TTL) -> list:
         """Get agenda items for a meeting."""
         url = f"{BASE_URL}/events/{event_id}/EventItems"
-        return self._api_get(url) or []
+        return self._api_get(url, ttl=ttl) or []
 
-    def fetch_roll_calls(self, event_item_id: int) -> list:
+    def fetch_roll_calls(self, event_item_id: int, ttl: int = CACHE_TTL) -> list:
         """Get roll call data for an agenda item (used for attendance)."""
         url = f"{BASE_URL}/EventItems/{event_item_id}/RollCalls"
-        return self._api_get(url) or []
+        return self._api_get(url, ttl=ttl) or []
 
-    def fetch_item_votes(self, event_item_id: int) -> list:
+    def fetch_item_votes(self, event_item_id: int, ttl: int = CACHE_TTL) -> list:
         """Get individual legislation votes for an agenda item."""
         url = f"{BASE_URL}/EventItems/{event_item_id}/Votes"
-        return self._api_get(url) or []
+        return self._api_get(url, ttl=ttl) or []
 
     def fetch_matter_details(self, matter_id: int):
         """Get full matter details (type, status, dates, enactment info)."""
         url = f"{BASE_URL}/matters/{matter_id}"
-        return self._api_get(url)
+        return self._api_get(url, ttl=self.quarter_ttl)
 
     def fetch_matter_attachments(self, matter_id: int) -> list:
         """Get attachments for a matter (PDFs, supporting docs)."""
         url = f"{BASE_URL}/matters/{matter_id}/attachments"
-        return self._api_get(url) or []
+        return self._api_get(url, ttl=self.quarter_ttl) or []
+
+    def _submit_matter(self, matter_id: int):
+        """Queue details + attachments fetches for a matter (once per matter)."""
+        if matter_id not in self.matter_futures:
+            self.matter_futures[matter_id] = (
+                self.pool.submit(self.fetch_matter_details, matter_id),
+                self.pool.submit(self.fetch_matter_attachments, matter_id),
+            )
 
     def collect_event_items(self, meetings: list) -> list:
-        """Phase 1: Collect all API data from meetings."""
+        """
+        Phase 1: Collect all API data from meetings.
+        Per-item votes and matter data are fetched in the background as items
+        are found; votes are resolved here, matters in enrich_matter_data.
+        """
         print("\n=== Phase 1: Collecting API data ===")
         all_items = []
 
@@ -194,33 +392,31 @@ class ColumbusExtractionWorkflow:
                 'event_time': meeting.get('EventTime') or '',
             }
 
-            items = self.fetch_event_items(event_id)
+            # Recent or upcoming meetings may still gain items, outcomes and votes
+            meeting_ttl = self._ttl_for(event_date)
+            items = self.fetch_event_items(event_id, meeting_ttl)
             print(f"  Found {len(items)} agenda items")
 
-            # First pass: find the attendance roll call
-            for item in items:
-                if 'ROLL CALL' in (item.get('EventItemTitle') or '').upper():
-                    roll_calls = self.fetch_roll_calls(item['EventItemId'])
-                    attendance = {}
-                    for rc in roll_calls:
-                        member_name = rc['RollCallPersonName']
-                        vote_value = rc['RollCallValueName']
-                        self.all_members.add(member_name)
-                        attendance[member_name] = vote_value
-                    self.attendance_by_meeting[event_id] = attendance
-                    print(f"  Found attendance roll call: {len(attendance)} members")
-                    break
-
-            # Second pass: record all items with votes/actions
+            # Single pass: read attendance from the first roll call and record all
+            # items with votes/actions. Every item shares the meeting's attendance
+            # dict, which is filled in once the roll call is reached.
+            meeting_attendance = {}
+            found_roll_call = False
             for item in items:
+                title = item.get('EventItemTitle') or ''
+                if not found_roll_call and 'ROLL CALL' in title.upper():
+                    roll_calls = self.fetch_roll_calls(item['EventItemId'], meeting_ttl)
+                    meeting_attendance.update(
+                        {rc['RollCallPersonName']: rc['RollCallValueName'] for rc in roll_calls}
+                    )
+                    self.attendance_by_meeting[event_id] = meeting_attendance
+                    found_roll_call = True
+                    print(f"  Found attendance roll call: {len(meeting_attendance)} members")
+
                 # Skip pure procedural headers
-                title = item.get('EventItemTitle', '') or ''
                 if title.startswith('REGULAR MEETING NO.') or not title.strip():
                     continue
 
-                # Get member attendance for this meeting
-                meeting_attendance = self.attendance_by_meeting.get(event_id, {})
-
                 item_data = {
                     'event_id': event_id,
                     'event_date': event_date,
@@ -262,21 +458,23 @@ class ColumbusExtractionWorkflow:
                 }
                 all_items.append(item_data)
 
-        # Third pass: fetch per-item votes for items with vote outcomes
+                # Start network fetches now so they overlap the rest of Phase 1
+                if item_data['passed'] is not None:
+                    item_data['_votes_future'] = self.pool.submit(
+                        self.fetch_item_votes, item['EventItemId'], meeting_ttl
+                    )
+                if item_data['matter_id']:
+                    self._submit_matter(item_data['matter_id'])
+
+        # Third pass: collect per-item votes for items with vote outcomes
         voted = [i for i in all_items if i['passed'] is not None]
-        print(f"\nFetching per-item votes for {len(voted)} voted items...")
+        print(f"\nCollecting per-item votes for {len(voted)} voted items...")
         found_votes = 0
         for idx, item in enumerate(voted, 1):
             if idx % 100 == 0:
                 print(f"  Progress: {idx}/{len(voted)} items checked...")
-            votes = self.fetch_item_votes(item['event_item_id'])
-            item_votes = {}
-            for v in votes:
-                name = v.get('VotePersonName', '')
-                value = v.get('VoteValueName', '')
-                if name:
-                    self.all_members.add(name)
-                    item_votes[name] = value
+            votes = item.pop('_votes_future').result()
+            item_votes = {v['VotePersonName']: v.get('VoteValueName', '') for v in votes if v.get('VotePersonName')}
             item['item_votes'] = item_votes
             if item_votes:
                 found_votes += 1
@@ -287,6 +485,12 @@ class ColumbusExtractionWorkflow:
 
         print(f"Per-item votes found for {found_votes}/{len(voted)} voted items")
 
+        # Members = everyone seen in an attendance roll call or a per-item vote
+        self.all_members = frozenset().union(
+            *self.attendance_by_meeting.values(),
+            *(item['item_votes'] for item in voted),
+        )
+
         return all_items
 
     def enrich_matter_data(self, all_items: list):
@@ -299,20 +503,28 @@ class ColumbusExtractionWorkflow:
                 unique_matter_ids.add(mid)
         print(f"Unique matters to fetch: {len(unique_matter_ids)}")
 
-        for i, mid in enumerate(sorted(unique_matter_ids), 1):
-            print(f"  [{i}/{len(unique_matter_ids)}] Fetching matter {mid}...")
-            details = self.fetch_matter_details(mid)
-            attachments = self.fetch_matter_attachments(mid)
-            self.matter_cache[mid] = {
-                'details': details,
-                'attachments': attachments,
-            }
+        # Record each matter as soon as both of its fetches have finished
+        future_to_mid = {}
+        for mid in unique_matter_ids:
+            self._submit_matter(mid)
+            for future in self.matter_futures[mid]:
+                future_to_mid[future] = mid
+        fetched = 0
+        for future in as_completed(future_to_mid):
+            mid = future_to_mid[future]
+            details_future, attachments_future = self.matter_futures[mid]
+            if mid in self.matter_cache or not (details_future.done() and attachments_future.done()):
+                continue
+            self.matter_cache[mid] = MatterRec(details_future.result(), attachments_future.result())
+            fetched += 1
+            print(f"  [{fetched}/{len(unique_matter_ids)}] Fetched matter {mid}")
+        self.matter_futures.clear()
 
         # Populate matter fields on each item
         for item in all_items:
-            mid = item.get('matter_id')
-            if mid and mid in self.matter_cache:
-                details = self.matter_cache[mid].get('details')
+            rec = self.matter_cache.get(item.get('matter_id'))
+            if rec:
+                details = rec.details
                 if details:
                     item['matter_title'] = details.get('MatterTitle', '') or ''
                     item['matter_type_name'] = details.get('MatterTypeName', '') or ''
@@ -327,121 +539,212 @@ class ColumbusExtractionWorkflow:
                     item['matter_requester'] = details.get('MatterRequester', '') or ''
                     item['matter_body_name'] = details.get('MatterBodyName', '') or ''
 
-                attachments = self.matter_cache[mid].get('attachments', [])
+                attachments = rec.attachments
                 if attachments:
                     links = [a.get('MatterAttachmentHyperlink', '') for a in attachments if a.get('MatterAttachmentHyperlink')]
                     item['attachment_links'] = '|'.join(links)
 
         print(f"Matter details populated for {sum(1 for i in all_items if i.get('matter_title'))} items")
 
-    def scrape_legislation_urls(self, page, meeting_insite_url: str) -> dict:
+    async def scrape_legislation_urls(self, page, meeting_insite_url: str) -> dict:
         """
         Scrape the meeting detail web page to build a mapping of
         matter file numbers to their LegislationDetail web URLs.
         """
         file_to_url = {}
         try:
-            page.goto(meeting_insite_url, wait_until="domcontentloaded")
-            page.wait_for_load_state("networkidle")
-            time.sleep(1)
+            await asyncio.to_thread(self.web_limiter.acquire)
+            await page.goto(meeting_insite_url, wait_until="domcontentloaded")
+            await page.wait_for_selector('a[href*="LegislationDetail"]', state="attached", timeout=5000)
 
-            links = page.eval_on_selector_all(
+            # Build the file-number -> URL object in the page: one round-trip, no Python loop
+            file_to_url = await page.eval_on_selector_all(
                 'a[href*="LegislationDetail"]',
-                '''els => els.map(el => ({
-                    fileNumber: el.textContent.trim(),
-                    href: el.href
-                }))'''
+                '''els => {
+                    const o = {};
+                    for (const el of els) {
+                        const k = el.textContent.trim();
+                        if (k && !(k in o)) o[k] = el.href;
+                    }
+                    return o;
+                }'''
             )
-            for link in links:
-                if link['fileNumber']:
-                    file_to_url[link['fileNumber']] = link['href']
 
             print(f"  Scraped {len(file_to_url)} legislation URLs from meeting page")
+        except PlaywrightTimeoutError:
+            print("  No legislation links found on meeting page")
         except Exception as e:
             print(f"  Error scraping meeting page: {e}")
 
         return file_to_url
 
-    def extract_full_text(self, page, legislation_url: str) -> str:
+    # Matches an Options= parameter that doesn't already request the Text tab
+    _OPTIONS_RE = re.compile(r'(Options=)(?!ID\|Text\|)')
+
+    @classmethod
+    def _full_text_url(cls, legislation_url: str) -> str:
         """
-        Navigate to a LegislationDetail page with FullText=1 and extract
-        the full legislative text from the Text tab.
+        Return the LegislationDetail URL with the Text tab and FullText=1 set.
+        Idempotent: already-normalized URLs are returned unchanged.
         """
-        # Append FullText=1 to get expanded text directly
-        if "FullText=1" not in legislation_url:
+        if "Options=" in legislation_url:
+            url = cls._OPTIONS_RE.sub(r'\1ID|Text|', legislation_url, count=1)
+        else:
             separator = "&" if "?" in legislation_url else "?"
-            if "Options=" in legislation_url:
-                legislation_url = legislation_url.replace("Options=", "Options=ID|Text|")
-            else:
-                legislation_url += f"{separator}Options=ID|Text|"
-            legislation_url += "&FullText=1"
+            url = f"{legislation_url}{separator}Options=ID|Text|"
+        if "FullText=1" not in url:
+            url += "&FullText=1"
+        return url
 
+    async def extract_full_text(self, page, legislation_url: str) -> str:
+        """
+        Navigate to a LegislationDetail page with FullText=1 and extract
+        the full legislative text from the Text tab.
+        """
         try:
-            page.goto(legislation_url, wait_until="domcontentloaded")
-            page.wait_for_load_state("networkidle")
-            time.sleep(0.5)
-
-            text_div = page.query_selector('#ctl00_ContentPlaceHolder1_divText')
-            if text_div:
-                text = text_div.inner_text().strip()
-                return text if text else None
-
+            await asyncio.to_thread(self.web_limiter.acquire)
+            await page.goto(self._full_text_url(legislation_url), wait_until="domcontentloaded")
+            text_div = await page.wait_for_selector(
+                '#ctl00_ContentPlaceHolder1_divText', state="attached", timeout=5000
+            )
+            text = (await text_div.inner_text()).strip()
+            return text if text else None
+        except PlaywrightTimeoutError:
+            # No text container on this page
             return None
         except Exception as e:
             print(f"    Error extracting text: {e}")
             return None
 
+    @staticmethod
+    async def _block_resources(route):
+        """Abort requests for resources the scrape never reads."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _run_page_workers(self, pages: list, jobs: list, handler):
+        """Run handler(page, job) for every job, one worker coroutine per page."""
+        queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+
+        async def worker(page):
+            while not queue.empty():
+                await handler(page, queue.get_nowait())
+
+        await asyncio.gather(*(worker(page) for page in pages))
+
+    def seed_text_cache(self):
+        """
+        Seed an empty full-text cache from an existing Votes CSV, so text
+        scraped before the cache existed is kept rather than overwritten.
+        """
+        csv_path = self.output_paths['votes']
+        if len(self.text_cache) or not csv_path.exists():
+            return
+        try:
+            csv.field_size_limit(1 << 30)  # full text can exceed the 128 KB default
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    matter_file = row.get('matter_file', '')
+                    text = row.get('Agenda_item_fulltext', '')
+                    if matter_file and text:
+                        self.text_cache[matter_file] = text
+            self.text_cache.sync()
+            print(f"Seeded full-text cache with {len(self.text_cache)} entries from {csv_path.name}")
+        except Exception as e:
+            print(f"Warning: could not load existing text: {e}")
+
+    def apply_cached_text(self, items: list) -> int:
+        """Fill Agenda_item_fulltext from the full-text cache; return count filled."""
+        filled = 0
+        for item in items:
+            matter_file = item['matter_file']
+            if matter_file and matter_file in self.text_cache:
+                item['Agenda_item_fulltext'] = self.text_cache[matter_file]
+                filled += 1
+        return filled
+
     def scrape_full_text(self, all_items: list):
-        """Phase 2: Scrape full text using Playwright."""
+        """Phase 2: Scrape full text using Playwright (cached text is reused)."""
         print("\n=== Phase 2: Scraping full legislative text via Playwright ===")
         items_with_matter = [i for i in all_items if i['matter_file']]
-        print(f"Items with matter files to scrape: {len(items_with_matter)}")
+        print(f"Items with matter files: {len(items_with_matter)}")
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        if not self.refresh:
+            cached = self.apply_cached_text(items_with_matter)
+            items_with_matter = [i for i in items_with_matter if not i['Agenda_item_fulltext']]
+            print(f"Reused {cached} cached texts, {len(items_with_matter)} items to scrape")
 
-            # For each meeting, scrape the meeting page to get file-number-to-URL mapping
+        if not items_with_matter:
+            print("\nFull text extraction complete: nothing left to scrape")
+            return
+
+        extracted, skipped = asyncio.run(self._scrape_full_text_async(items_with_matter))
+        self.text_cache.sync()
+
+        print(f"\nFull text extraction complete: {extracted} extracted, {skipped} skipped (no URL)")
+
+    async def _scrape_full_text_async(self, items_with_matter: list) -> tuple:
+        """Scrape meeting pages, then legislation pages, across a pool of tabs."""
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            context = await browser.new_context()
+            await context.route("**/*", self._block_resources)
+            pages = [await context.new_page() for _ in range(SCRAPE_PAGES)]
+
+            # Scrape each meeting page once to get the file-number-to-URL mapping
+            event_ids = list(dict.fromkeys(i['event_id'] for i in items_with_matter))
+            urls_by_event = {}
+
+            async def scrape_meeting(page, event_id):
+                insite_url = self.meeting_links[event_id]['insite_url']
+                if insite_url:
+                    print(f"\nScraping meeting page for EventId {event_id}...")
+                    urls_by_event[event_id] = await self.scrape_legislation_urls(page, insite_url)
+
+            await self._run_page_workers(pages, event_ids, scrape_meeting)
+
+            # Merge in meeting order so later meetings win, as with a serial scrape
             file_to_url_all = {}
-            processed_meetings = set()
-
-            for item in items_with_matter:
-                event_id = item['event_id']
-                if event_id not in processed_meetings:
-                    insite_url = self.meeting_links[event_id]['insite_url']
-                    if insite_url:
-                        print(f"\nScraping meeting page for EventId {event_id}...")
-                        file_to_url = self.scrape_legislation_urls(page, insite_url)
-                        file_to_url_all.update(file_to_url)
-                    processed_meetings.add(event_id)
+            for event_id in event_ids:
+                file_to_url_all.update(urls_by_event.get(event_id, {}))
 
             # Now extract full text for each agenda item
             total = len(items_with_matter)
-            extracted = 0
+            jobs = []
             skipped = 0
             for i, item in enumerate(items_with_matter, 1):
-                matter_file = item['matter_file']
-                legislation_url = file_to_url_all.get(matter_file)
-
-                if not legislation_url:
+                legislation_url = file_to_url_all.get(item['matter_file'])
+                if legislation_url:
+                    jobs.append((i, item, legislation_url))
+                else:
                     skipped += 1
-                    continue
 
-                print(f"  [{i}/{total}] Extracting text for {matter_file}...", end=" ")
-                full_text = self.extract_full_text(page, legislation_url)
+            extracted = 0
+
+            async def extract_item(page, job):
+                nonlocal extracted
+                i, item, legislation_url = job
+                full_text = await self.extract_full_text(page, legislation_url)
 
                 if full_text:
                     item['Agenda_item_fulltext'] = full_text
+                    self.text_cache[item['matter_file']] = full_text
                     extracted += 1
-                    print(f"OK ({len(full_text)} chars)")
+                    if extracted % TEXT_CACHE_SYNC_EVERY == 0:
+                        self.text_cache.sync()
+                    print(f"  [{i}/{total}] {item['matter_file']}: OK ({len(full_text)} chars)")
                 else:
-                    print("No text found")
+                    print(f"  [{i}/{total}] {item['matter_file']}: No text found")
 
-                time.sleep(0.5)
+            await self._run_page_workers(pages, jobs, extract_item)
 
-            browser.close()
+            await browser.close()
 
-        print(f"\nFull text extraction complete: {extracted} extracted, {skipped} skipped (no URL)")
+        return extracted, skipped
 
     VOTE_MAP = {
         'Affirmative': 'Yes',
@@ -452,54 +755,8 @@ class ColumbusExtractionWorkflow:
         'Present': 'Present',
     }
 
-    def _assign_votes(self, item, members_list):
-        """Assign vote values based on per-item votes or attendance fallback."""
-        votes = {}
-        item_votes = item.get('item_votes', {})
-        if item_votes:
-            # Use actual per-item roll call votes
-            for member in members_list:
-                if member in item_votes:
-                    votes[member] = self.VOTE_MAP.get(item_votes[member], item_votes[member])
-                else:
-                    att = item['attendance'].get(member, '')
-                    if att in ('Absent', 'Absent@vote'):
-                        votes[member] = 'Absent'
-                    else:
-                        votes[member] = ''
-        elif item.get('passed') == 1:
-            # Consent/voice vote - infer from attendance
-            for member in members_list:
-                att = item['attendance'].get(member, '')
-                if att in ('Absent', 'Absent@vote'):
-                    votes[member] = 'Absent'
-                else:
-                    votes[member] = 'Yes'
-        else:
-            for member in members_list:
-                votes[member] = ''
-        return votes
-
-    def load_existing_text(self) -> dict:
-        """Load Agenda_item_fulltext from existing CSV for preservation."""
-        text_map = {}
-        csv_path = self.output_paths['votes']
-        if csv_path.exists():
-            try:
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        key = row.get('event_item_id', '')
-                        text = row.get('Agenda_item_fulltext', '')
-                        if key and text:
-                            text_map[key] = text
-                print(f"Loaded {len(text_map)} existing text entries for preservation")
-            except Exception as e:
-                print(f"Warning: could not load existing text: {e}")
-        return text_map
-
     def write_output(self, all_items: list, persons_by_name: dict):
-        """Write output CSV files."""
+        """Write output CSV files (full text is released from items as rows are written)."""
         members_list = sorted(list(self.all_members))
         print(f"\nFound {len(members_list)} council members: {members_list}")
         print(f"Total agenda items: {len(all_items)}")
@@ -509,9 +766,10 @@ class ColumbusExtractionWorkflow:
             all_items = [i for i in all_items if i['passed'] is not None]
             print(f"Filtered to {len(all_items)} voted items (--votes-only)")
 
-        # Write CSV - all items
+        # Write CSVs - all items, plus voted items (unless already in votes-only mode)
         output_file = self.output_paths['votes']
-        fieldnames = [
+        output_voted = self.output_paths['voted_items']
+        scalar_fields = [
             'event_id', 'event_date', 'event_time', 'event_location',
             'event_item_id', 'agenda_number', 'agenda_sequence',
             'matter_file', 'matter_name', 'matter_title', 'matter_type', 'matter_type_name',
@@ -521,35 +779,43 @@ class ColumbusExtractionWorkflow:
             'title', 'action', 'action_text', 'passed', 'consent', 'tally', 'mover', 'seconder',
             'roll_call_flag', 'agenda_link', 'minutes_link', 'video_link', 'attachment_links',
             'Agenda_item_fulltext'
-        ] + members_list
+        ]
+        fieldnames = scalar_fields + members_list
+
+        # Rows are positional lists in fieldnames order (every item carries all scalar fields)
+        get_scalars = operator.itemgetter(*scalar_fields)
+        member_tuple = tuple(members_list)
+        vote_map_get = self.VOTE_MAP.get
+        voted_count = 0
+        with ExitStack() as stack:
+            f = stack.enter_context(
+                open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+            )
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            voted_writer = None
+            if not self.votes_only:
+                f_voted = stack.enter_context(
+                    open(output_voted, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE)
+                )
+                voted_writer = csv.writer(f_voted)
+                voted_writer.writerow(fieldnames)
 
             for item in all_items:
-                row = {k: item.get(k, '') for k in fieldnames if k not in members_list}
-                row.update(self._assign_votes(item, members_list))
+                row = [*get_scalars(item), *_assign_votes(item, member_tuple, vote_map_get)]
                 writer.writerow(row)
+                if voted_writer and item['passed'] is not None:
+                    voted_writer.writerow(row)
+                    voted_count += 1
+                # Text is written; let it be freed instead of holding every item's text to the end
+                # (blanked rather than removed, so the item keeps every CSV field)
+                item['Agenda_item_fulltext'] = ''
 
         print(f"\nCSV written to: {output_file}")
-
-        # Also write a filtered version with only voted items (unless already in votes-only mode)
         if not self.votes_only:
-            voted_items = [i for i in all_items if i['passed'] is not None]
-            output_voted = self.output_paths['voted_items']
-
-            with open(output_voted, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for item in voted_items:
-                    row = {k: item.get(k, '') for k in fieldnames if k not in members_list}
-                    row.update(self._assign_votes(item, members_list))
-                    writer.writerow(row)
-
             print(f"Voted items CSV: {output_voted}")
-            print(f"Total voted items: {len(voted_items)}")
+            print(f"Total voted items: {voted_count}")
 
         # Write Persons CSV
         output_persons = self.output_paths['persons']
@@ -571,39 +837,43 @@ class ColumbusExtractionWorkflow:
         print("=" * 70)
         print(f"Columbus City Council Data Extraction - {self.year} Q{self.quarter}")
         print(f"Date range: {self.start_date} to {self.end_date}")
+        if self.quarter_ttl != CACHE_TTL:
+            print(f"Quarter not settled yet: recent API data is cached for {RECENT_CACHE_TTL // 60} minutes only")
         print("=" * 70)
 
-        # Phase 1: Collect API data
-        persons_by_name = self.fetch_persons()
-        meetings = self.fetch_meetings()
+        try:
+            # Phase 1: Collect API data
+            persons_by_name = self.fetch_persons()
+            meetings = self.fetch_meetings()
 
-        if not meetings:
-            print(f"\nNo meetings found for {self.year} Q{self.quarter}")
-            return
+            if not meetings:
+                print(f"\nNo meetings found for {self.year} Q{self.quarter}")
+                return
 
-        all_items = self.collect_event_items(meetings)
+            all_items = self.collect_event_items(meetings)
 
-        # Phase 1.5: Fetch matter details
-        self.enrich_matter_data(all_items)
+            # Phase 1.5: Fetch matter details
+            self.enrich_matter_data(all_items)
 
-        # Phase 2: Web scraping (optional)
-        if not self.skip_text:
-            self.scrape_full_text(all_items)
-        else:
-            print("\n[Skipping Phase 2: Full text scraping (--skip-text)]")
-            # Preserve existing text from previous extraction
-            text_map = self.load_existing_text()
-            if text_map:
-                preserved = 0
-                for item in all_items:
-                    eid = str(item['event_item_id'])
-                    if eid in text_map:
-                        item['Agenda_item_fulltext'] = text_map[eid]
-                        preserved += 1
-                print(f"Preserved {preserved} text entries from existing CSV")
-
-        # Phase 3: Write output files
-        self.write_output(all_items, persons_by_name)
+            # Text from runs before the full-text cache existed lives only in the Votes CSV
+            self.seed_text_cache()
+
+            # Phase 2: Web scraping (optional)
+            if not self.skip_text:
+                self.scrape_full_text(all_items)
+            else:
+                print("\n[Skipping Phase 2: Full text scraping (--skip-text)]")
+                # Preserve text scraped by previous runs
+                preserved = self.apply_cached_text(all_items)
+                print(f"Preserved {preserved} text entries from the full-text cache")
+
+            # Phase 3: Write output files
+            self.write_output(all_items, persons_by_name)
+        finally:
+            # Drop fetches still queued from Phase 1 so an error or Ctrl-C exits promptly
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.cache.close()
+            self.text_cache.close()
 
         print("\n" + "=" * 70)
         print("Extraction complete!")
@@ -624,6 +894,9 @@ Examples:
 
     # Extract only voted items
     python extract_columbus.py --year 2023 --quarter 1 --votes-only
+
+    # Ignore cached API responses and text, refetch everything
+    python extract_columbus.py --year 2023 --quarter 2 --refresh
         """
     )
     parser.add_argument("--year", type=int, required=True,
@@ -636,6 +909,8 @@ Examples:
                         help="Only output items with votes")
     parser.add_argument("--output-dir", type=Path,
                         help="Override default output directory")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Refetch API data and re-scrape text instead of reading the on-disk caches")
 
     args = parser.parse_args()
 
@@ -644,7 +919,8 @@ Examples:
         quarter=args.quarter,
         skip_text=args.skip_text,
         votes_only=args.votes_only,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        refresh=args.refresh
     )
     workflow.run()
 
@@ -9,43 +9,232 @@ This script captures:
 - All agenda items with their outcomes (action, passed flag)
 - Council member attendance for each meeting (from attendance roll call)
 - Meeting-level links: agenda PDF, minutes PDF, video
-- Full legislative text for each agenda item (via Playwright web scraping)
+- Full legislative text for each agenda item (via HTTP, Playwright fallback)
 - EventItem fields: agenda_sequence, consent, mover, seconder, tally, action_text, matter_type, matter_status
 - Event fields: event_location, event_time
-- Matter details (via /matters/{id}): type_name, status_name, intro/passed/enactment dates, requester, body_name, title
-- Attachment links (via /matters/{id}/attachments): pipe-delimited hyperlinks
+- Matter details (via batched /matters?$filter=...): type_name, status_name, intro/passed/enactment dates, requester, body_name, title
+- Attachment links (inline in EventItems via Attachments=1): pipe-delimited hyperlinks
 - Persons CSV: contact data for all persons in the system
 
 Requirements:
     pip install requests playwright
     playwright install chromium
+    pip install orjson  # optional, faster JSON parsing of API responses
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
+import os
 import requests
 import csv
+import random
+import shelve
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from legistar_html import DivTextParser, LegislationLinkParser
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 BASE_URL = "https://webapi.legistar.com/v1/columbus"
 LEGISTAR_WEB = "https://columbus.legistar.com"
 
-# Create session with retry logic
-session = requests.Session()
-retry = Retry(total=5, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-adapter = HTTPAdapter(max_retries=retry)
-session.mount('http://', adapter)
-session.mount('https://', adapter)
+# Concurrent API requests, sharing one token-bucket rate budget. The rate starts at
+# REQUESTS_PER_SECOND and adapts (AIMD): +1 req/s per RATE_INCREASE_EVERY successes,
+# halved on a 429, kept within MIN/MAX_REQUESTS_PER_SECOND
+MAX_WORKERS = 8
+REQUESTS_PER_SECOND = 10
+MIN_REQUESTS_PER_SECOND = 1
+MAX_REQUESTS_PER_SECOND = 40
+RATE_INCREASE_EVERY = 20
+
+# Legistar web pages (columbus.legistar.com) get their own fixed, much lower budget:
+# one page per 0.5s, shared by the HTTP workers and every Playwright tab
+WEB_REQUESTS_PER_SECOND = 2
+
+# Matter IDs per /matters $filter request (keeps the query string well under URL limits)
+MATTER_BATCH_SIZE = 20
+
+# GET responses (API JSON and web pages) are cached on disk for re-runs
+HTTP_CACHE_PATH = Path(__file__).parent / ".legistar_cache-q1-2023"
+CACHE_TTL = 86400
+
+# Phase 2 results, kept across runs so a re-run only scrapes what is still missing
+# (including Playwright-scraped pages, which the HTTP cache can't cover).
+# Q1 2023 is closed, so these don't expire; delete the files to re-scrape.
+URL_MAP_CACHE_PATH = Path(__file__).parent / ".legislation_urls_cache-q1-2023"
+FULLTEXT_CACHE_PATH = Path(__file__).parent / ".fulltext_cache-q1-2023"
+
+# Phase 2 Playwright fallback: concurrent tabs in one browser, and pages per tab before replacing it
+SCRAPE_PAGES = 4
+RECYCLE_AFTER = 100
+
+# Requests the Playwright pages never need: by resource type, and analytics hosts (and their subdomains)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+
+# Headless Chromium flags that skip GPU, extensions and the /dev/shm size limit
+CHROMIUM_ARGS = ['--disable-gpu', '--disable-dev-shm-usage', '--disable-extensions']
+
+# Chromium's sandbox can't start as root inside a container; set CHROMIUM_NO_SANDBOX=1
+# only for such runs, since the fallback loads third-party pages
+if os.environ.get('CHROMIUM_NO_SANDBOX'):
+    CHROMIUM_ARGS.append('--no-sandbox')
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: holds up to max_tokens, refills refill_per_sec
+    per second. If adaptive, the refill rate is adjusted by success() and
+    throttled(); otherwise those are no-ops and the rate stays fixed.
+    """
+
+    def __init__(self, max_tokens, refill_per_sec, adaptive=False):
+        self.max_tokens = max_tokens
+        self.adaptive = adaptive
+        self.tokens = max_tokens
+        self.refill_per_sec = refill_per_sec
+        self.updated = time.monotonic()
+        self.successes = 0
+        self.last_decrease = 0.0
+        self.lock = threading.Lock()
+
+    def success(self):
+        """Additive increase: +1 req/s after every RATE_INCREASE_EVERY successful requests"""
+        if not self.adaptive:
+            return
+        with self.lock:
+            self.successes += 1
+            if self.successes >= RATE_INCREASE_EVERY:
+                self.successes = 0
+                self.refill_per_sec = min(MAX_REQUESTS_PER_SECOND, self.refill_per_sec + 1)
+
+    def throttled(self):
+        """
+        Multiplicative decrease on a 429: halve the rate and drop banked tokens.
+        Workers throttled together count once (at most one halving per second).
+        """
+        if not self.adaptive:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.successes = 0
+            self.tokens = 0
+            if now - self.last_decrease >= 1:
+                self.last_decrease = now
+                self.refill_per_sec = max(MIN_REQUESTS_PER_SECOND, self.refill_per_sec / 2)
+                print(f"  Throttled by server, API rate now {self.refill_per_sec:g} req/s")
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.max_tokens, self.tokens + (now - self.updated) * self.refill_per_sec)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_per_sec
+            time.sleep(wait)
+
+class JitterRetry(Retry):
+    """Retry with randomized exponential backoff so parallel workers don't retry in lockstep"""
+
+    BACKOFF_CAP = 60
+
+    def get_backoff_time(self):
+        upper = min(self.BACKOFF_CAP, self.backoff_factor * 3 ** len(self.history))
+        return random.uniform(self.backoff_factor, upper)
+
+class ApiRetry(JitterRetry):
+    """JitterRetry for the Web API session: every 429 also slows the adaptive API limiter"""
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        # Every 429, including ones retried here, slows the shared limiter down
+        if response is not None and response.status == 429:
+            limiter.throttled()
+        return super().increment(method, url, response, *args, **kwargs)
+
+def make_session(retry_class):
+    """
+    Session with retry logic (Retry-After is honored on 429/503; final
+    429s are returned rather than raised so cached_get can back off)
+    """
+    new_session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry_class(
+        total=8,
+        backoff_factor=1,
+        status_forcelist=frozenset([429, 500, 502, 503, 504]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ), pool_maxsize=MAX_WORKERS)
+    new_session.mount('http://', adapter)
+    new_session.mount('https://', adapter)
+    return new_session
+
+# Web API and web pages use separate sessions and budgets, so page scraping
+# never drives the API rate and API feedback never speeds up page scraping
+session = make_session(ApiRetry)
+web_session = make_session(JitterRetry)
+limiter = RateLimiter(REQUESTS_PER_SECOND, REQUESTS_PER_SECOND, adaptive=True)
+web_limiter = RateLimiter(1, WEB_REQUESTS_PER_SECOND)
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+http_cache = shelve.open(str(HTTP_CACHE_PATH))
+http_cache_lock = threading.Lock()
+atexit.register(http_cache.close)
+
+url_map_cache = shelve.open(str(URL_MAP_CACHE_PATH))  # str(EventId) -> {matter file: legislation URL}
+fulltext_cache = shelve.open(str(FULLTEXT_CACHE_PATH))  # matter file -> full text
+atexit.register(url_map_cache.close)
+atexit.register(fulltext_cache.close)
+
+def cached_get(url, params=None, http_session=session, rate_limiter=limiter):
+    """
+    GET through the on-disk cache; only cache misses are rate limited
+    (by rate_limiter, sent on http_session - the Web API ones by default).
+    Returns (final_url, body bytes) for a 200 response, otherwise None.
+    """
+    key = hashlib.sha1(f"{url}|{sorted((params or {}).items())}".encode()).hexdigest()
+    with http_cache_lock:
+        entry = http_cache.get(key)
+    if entry and time.time() - entry[0] < CACHE_TTL:
+        return entry[1]
+
+    rate_limiter.acquire()
+    response = http_session.get(url, params=params, timeout=30)
+    if response.status_code == 429:
+        # Still throttled after retries: wait as long as the server asks
+        # (or the longest backoff), then try once more before giving up
+        retry_after = response.headers.get('Retry-After')
+        retry = http_session.get_adapter(url).max_retries
+        time.sleep(retry.parse_retry_after(retry_after) if retry_after else JitterRetry.BACKOFF_CAP)
+        rate_limiter.acquire()
+        response = http_session.get(url, params=params, timeout=30)
+    if response.status_code != 200:
+        return None
+    rate_limiter.success()
+
+    result = (response.url, response.content)
+    with http_cache_lock:
+        http_cache[key] = (time.time(), result)
+    return result
 
 def api_get(url, params=None):
-    """Make API request with rate limiting"""
-    time.sleep(0.25)
+    """Make API request with caching and rate limiting (safe to call from executor threads)"""
     try:
-        response = session.get(url, params=params, timeout=30)
-        if response.status_code == 200:
-            return response.json()
-        return None
+        result = cached_get(url, params)
+        return json_loads(result[1]) if result and result[1] else None
     except Exception as e:
         print(f"  Error fetching {url}: {e}")
         time.sleep(2)
@@ -61,17 +250,23 @@ def get_q1_2023_meetings():
     return api_get(url, params) or []
 
 def get_event_items(event_id):
-    """Get agenda items for a meeting"""
+    """Get agenda items for a meeting, with each item's matter attachments inline"""
     url = f"{BASE_URL}/events/{event_id}/EventItems"
-    return api_get(url) or []
+    return api_get(url, {"Attachments": 1}) or []
 
 def get_roll_calls(event_item_id):
     """Get individual votes for an agenda item"""
     url = f"{BASE_URL}/EventItems/{event_item_id}/RollCalls"
     return api_get(url) or []
 
+def get_matters(matter_ids):
+    """Get full matter details (type, status, dates, enactment info) for a batch of matters in one call"""
+    url = f"{BASE_URL}/matters"
+    params = {"$filter": " or ".join(f"MatterId eq {mid}" for mid in matter_ids)}
+    return api_get(url, params) or []
+
 def get_matter_details(matter_id):
-    """Get full matter details (type, status, dates, enactment info)"""
+    """Get full matter details for one matter (for any a batched call left out)"""
     url = f"{BASE_URL}/matters/{matter_id}"
     return api_get(url)
 
@@ -85,7 +280,16 @@ def get_persons():
     url = f"{BASE_URL}/persons"
     return api_get(url) or []
 
-def scrape_legislation_urls(page, meeting_insite_url):
+def web_get(url):
+    """Fetch a Legistar web page as (final_url, html), cached like api_get; None on failure"""
+    try:
+        result = cached_get(url, http_session=web_session, rate_limiter=web_limiter)
+        return (result[0], result[1].decode('utf-8', errors='replace')) if result else None
+    except Exception as e:
+        print(f"  Error fetching {url}: {e}")
+        return None
+
+async def scrape_legislation_urls(page, meeting_insite_url):
     """
     Scrape the meeting detail web page to build a mapping of
     matter file numbers to their LegislationDetail web URLs.
@@ -95,11 +299,11 @@ def scrape_legislation_urls(page, meeting_insite_url):
     """
     file_to_url = {}
     try:
-        page.goto(meeting_insite_url, wait_until="domcontentloaded")
-        page.wait_for_load_state("networkidle")
-        time.sleep(1)
+        await asyncio.to_thread(web_limiter.acquire)
+        await page.goto(meeting_insite_url, wait_until="domcontentloaded")
+        await page.wait_for_selector('a[href*="LegislationDetail"]', state="attached", timeout=10000)
 
-        links = page.eval_on_selector_all(
+        links = await page.eval_on_selector_all(
             'a[href*="LegislationDetail"]',
             '''els => els.map(el => ({
                 fileNumber: el.textContent.trim(),
@@ -111,42 +315,142 @@ def scrape_legislation_urls(page, meeting_insite_url):
                 file_to_url[link['fileNumber']] = link['href']
 
         print(f"  Scraped {len(file_to_url)} legislation URLs from meeting page")
+    except PlaywrightTimeoutError:
+        print("  No legislation links found on meeting page")
     except Exception as e:
         print(f"  Error scraping meeting page: {e}")
 
     return file_to_url
 
-def extract_full_text(page, legislation_url):
+def scrape_legislation_urls_http(meeting_insite_url):
+    """
+    Same mapping as scrape_legislation_urls, from the server-rendered
+    meeting page via plain HTTP. Returns {} if no links were found.
+    """
+    page = web_get(meeting_insite_url)
+    if page is None:
+        return {}
+    page_url, html = page
+    parser = LegislationLinkParser(page_url)
+    parser.feed(html)
+    return parser.file_to_url
+
+def with_fulltext(legislation_url):
+    """LegislationDetail URL with the Text tab expanded (Options includes ID and Text, FullText=1)"""
+    parts = urlsplit(legislation_url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    options = [o for o in query.get('Options', '').split('|') if o]
+    options += [o for o in ('ID', 'Text') if o not in options]
+    query['Options'] = '|'.join(options) + '|'
+    query['FullText'] = '1'
+    return urlunsplit(parts._replace(query=urlencode(query, safe='|')))
+
+def extract_full_text_http(legislation_url):
+    """
+    Extract the full legislative text with a plain GET - the FullText=1 page
+    is server-rendered. Returns None if the text container is missing (so
+    the caller can fall back to Playwright), '' if it is present but empty.
+    """
+    page = web_get(legislation_url)
+    if page is None:
+        return None
+    parser = DivTextParser('ctl00_ContentPlaceHolder1_divText')
+    parser.feed(page[1])
+    return parser.text() if parser.found else None
+
+async def extract_full_text(page, legislation_url):
     """
     Navigate to a LegislationDetail page with FullText=1 and extract
     the full legislative text from the Text tab.
     """
-    # Append FullText=1 to get expanded text directly
-    if "FullText=1" not in legislation_url:
-        separator = "&" if "?" in legislation_url else "?"
-        # Also set Options to show Text tab
-        if "Options=" in legislation_url:
-            legislation_url = legislation_url.replace("Options=", "Options=ID|Text|")
-        else:
-            legislation_url += f"{separator}Options=ID|Text|"
-        legislation_url += "&FullText=1"
-
     try:
-        page.goto(legislation_url, wait_until="domcontentloaded")
-        page.wait_for_load_state("networkidle")
-        time.sleep(0.5)
-
-        # Extract text from the full text container div
-        text_div = page.query_selector('#ctl00_ContentPlaceHolder1_divText')
-        if text_div:
-            text = text_div.inner_text().strip()
-            return text if text else None
+        await asyncio.to_thread(web_limiter.acquire)
+        await page.goto(legislation_url, wait_until="domcontentloaded")
 
+        # Extract text from the full text container div as soon as it is in the DOM
+        text_div = await page.wait_for_selector(
+            '#ctl00_ContentPlaceHolder1_divText', state="attached", timeout=10000
+        )
+        text = (await text_div.inner_text()).strip()
+        return text if text else None
+    except PlaywrightTimeoutError:
+        # No text container on this page
         return None
     except Exception as e:
         print(f"    Error extracting text: {e}")
         return None
 
+async def block_resources(route):
+    """Playwright route handler: abort requests the scrape never reads"""
+    request = route.request
+    host = urlsplit(request.url).hostname or ''
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            host == h or host.endswith('.' + h) for h in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def scrape_meetings_playwright(insite_urls):
+    """Playwright fallback for meeting pages: {event_id: insite_url} -> {event_id: file_to_url}"""
+    urls_by_meeting = {}
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        context = await browser.new_context()
+        await context.route("**/*", block_resources)
+        page = await context.new_page()
+        for event_id, insite_url in insite_urls.items():
+            print(f"\nScraping meeting page for EventId {event_id} with Playwright...")
+            urls_by_meeting[event_id] = await scrape_legislation_urls(page, insite_url)
+        await browser.close()
+    return urls_by_meeting
+
+async def scrape_full_text_playwright(jobs, total, fulltext):
+    """
+    Playwright fallback for full text: store text in fulltext (keyed by
+    matter file) for each (index, item, url) job, running concurrently over a pool of
+    SCRAPE_PAGES tabs in one browser. A tab is replaced after
+    RECYCLE_AFTER pages to bound memory. Returns the number extracted.
+    """
+    extracted = 0
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        context = await browser.new_context()
+        await context.route("**/*", block_resources)
+        page_pool = asyncio.Queue()
+        navigations = {}  # page -> pages loaded in that tab
+        for _ in range(min(SCRAPE_PAGES, len(jobs))):
+            page = await context.new_page()
+            navigations[page] = 0
+            page_pool.put_nowait(page)
+
+        async def scrape_one(job):
+            nonlocal extracted
+            i, item, legislation_url = job
+            page = await page_pool.get()
+            try:
+                if navigations[page] >= RECYCLE_AFTER:
+                    del navigations[page]
+                    await page.close()
+                    page = await context.new_page()
+                    navigations[page] = 0
+
+                full_text = await extract_full_text(page, legislation_url)
+                navigations[page] += 1
+            finally:
+                page_pool.put_nowait(page)
+
+            if full_text:
+                fulltext[item['matter_file']] = full_text
+                extracted += 1
+                print(f"  [{i}/{total}] {item['matter_file']}: OK ({len(full_text)} chars)")
+            else:
+                print(f"  [{i}/{total}] {item['matter_file']}: No text found")
+
+        await asyncio.gather(*(scrape_one(job) for job in jobs))
+        await browser.close()
+
+    return extracted
+
 def main():
     # Fetch persons (one bulk call for contact data)
     print("Fetching persons list...")
@@ -164,19 +468,28 @@ def main():
 
     # Track attendance per meeting
     attendance_by_meeting = {}
-    meeting_links = {}  # event_id -> {agenda_link, minutes_link, video_link, event_location, event_time}
-    all_members = set()
+    meeting_links = {}  # event_id -> {event_date, agenda_link, minutes_link, video_link, event_location, event_time, attendance}
     all_items = []
+    unique_matter_ids = set()
+    attachments_by_matter = {}  # matter_id -> attachments returned inline with EventItems
 
     # Phase 1: Collect all API data
     print("\n=== Phase 1: Collecting API data ===")
+
+    # Fetch every meeting's items concurrently; attendance roll calls are submitted
+    # from the item pass below and collected once all meetings are processed
+    event_ids = [m['EventId'] for m in meetings]
+    items_by_meeting = dict(zip(event_ids, executor.map(get_event_items, event_ids)))
+    roll_call_futures = {}
+
     for meeting in meetings:
         event_id = meeting['EventId']
         event_date = meeting['EventDate'][:10]
         print(f"\nProcessing meeting {event_date} (EventId: {event_id})...")
 
         # Store meeting-level links and event fields
-        meeting_links[event_id] = {
+        meeting_links[event_id] = meeting_info = {
+            'event_date': event_date,
             'agenda_link': meeting.get('EventAgendaFile') or '',
             'minutes_link': meeting.get('EventMinutesFile') or '',
             'video_link': meeting.get('EventVideoPath') or '',
@@ -185,38 +498,30 @@ def main():
             'event_time': meeting.get('EventTime') or '',
         }
 
-        items = get_event_items(event_id)
+        items = items_by_meeting[event_id]
         print(f"  Found {len(items)} agenda items")
 
-        # First pass: find the attendance roll call
-        for item in items:
-            if 'ROLL CALL' in (item.get('EventItemTitle') or '').upper():
-                roll_calls = get_roll_calls(item['EventItemId'])
-                attendance = {}
-                for rc in roll_calls:
-                    member_name = rc['RollCallPersonName']
-                    vote_value = rc['RollCallValueName']
-                    all_members.add(member_name)
-                    attendance[member_name] = vote_value
-                attendance_by_meeting[event_id] = attendance
-                print(f"  Found attendance roll call: {len(attendance)} members")
-                break
-
-        # Second pass: record all items with votes/actions
+        # Single pass: find the attendance roll call and record all items with votes/actions
         for item in items:
-            # Skip pure procedural headers
             title = item.get('EventItemTitle', '') or ''
+            if event_id not in roll_call_futures and 'ROLL CALL' in title.upper():
+                roll_call_futures[event_id] = executor.submit(get_roll_calls, item['EventItemId'])
+
+            # Skip pure procedural headers
             if title.startswith('REGULAR MEETING NO.') or not title.strip():
                 continue
 
-            # Get member attendance for this meeting
-            meeting_attendance = attendance_by_meeting.get(event_id, {})
+            matter_id = item.get('EventItemMatterId')
+            if matter_id:
+                unique_matter_ids.add(matter_id)
+                attachments = item.get('EventItemMatterAttachments')
+                if attachments is not None:
+                    attachments_by_matter[matter_id] = attachments
 
+            # Meeting-level fields and attendance are shared by reference, not copied per item
             item_data = {
                 'event_id': event_id,
-                'event_date': event_date,
-                'event_time': meeting_links[event_id]['event_time'],
-                'event_location': meeting_links[event_id]['event_location'],
+                'meeting': meeting_info,
                 'event_item_id': item['EventItemId'],
                 'agenda_number': item.get('EventItemAgendaNumber', ''),
                 'agenda_sequence': item.get('EventItemAgendaSequence', ''),
@@ -233,7 +538,7 @@ def main():
                 'mover': item.get('EventItemMover', ''),
                 'seconder': item.get('EventItemSeconder', ''),
                 'roll_call_flag': item.get('EventItemRollCallFlag', 0),
-                'matter_id': item.get('EventItemMatterId'),
+                'matter_id': matter_id,
                 # Matter detail fields - populated in Phase 1.5
                 'matter_title': '',
                 'matter_type_name': '',
@@ -245,35 +550,62 @@ def main():
                 'matter_requester': '',
                 'matter_body_name': '',
                 'attachment_links': '',
-                'attendance': meeting_attendance,
-                'agenda_link': meeting_links[event_id]['agenda_link'],
-                'minutes_link': meeting_links[event_id]['minutes_link'],
-                'video_link': meeting_links[event_id]['video_link'],
-                'Agenda_item_fulltext': '',  # Will be filled in Phase 2
             }
             all_items.append(item_data)
 
+    # Attendance from each meeting's roll call
+    for meeting in meetings:
+        event_id = meeting['EventId']
+        if event_id in roll_call_futures:
+            roll_calls = roll_call_futures[event_id].result()
+            attendance = {rc['RollCallPersonName']: rc['RollCallValueName'] for rc in roll_calls}
+            attendance_by_meeting[event_id] = attendance
+            print(f"  Found attendance roll call for EventId {event_id}: {len(attendance)} members")
+        meeting_links[event_id]['attendance'] = attendance_by_meeting.get(event_id, {})
+
+    # Council members are everyone who appears in any meeting's attendance
+    all_members = set().union(*attendance_by_meeting.values())
+
     # Phase 1.5: Fetch Matter details + Attachments
     print("\n=== Phase 1.5: Fetching matter details and attachments ===")
-    unique_matter_ids = set()
-    for item in all_items:
-        mid = item.get('matter_id')
-        if mid:
-            unique_matter_ids.add(mid)
     print(f"Unique matters to fetch: {len(unique_matter_ids)}")
 
+    # Details come back MATTER_BATCH_SIZE matters per call
+    mids = sorted(unique_matter_ids)
+    batches = [mids[i:i + MATTER_BATCH_SIZE] for i in range(0, len(mids), MATTER_BATCH_SIZE)]
+    details_by_matter = {}
+    for i, matters in enumerate(executor.map(get_matters, batches), 1):
+        print(f"  [{i}/{len(batches)}] Fetched {len(matters)} matters")
+        for details in matters:
+            details_by_matter[details['MatterId']] = details
+
+    # A failed or short batch would lose up to MATTER_BATCH_SIZE matters; fetch those one by one
+    missing = [mid for mid in mids if mid not in details_by_matter]
+    if missing:
+        print(f"  Fetching details for {len(missing)} matters")
+        for mid, details in zip(missing, executor.map(get_matter_details, missing)):
+            if details:
+                details_by_matter[mid] = details
+
+    # Attachments normally arrived with the EventItems; fetch any the API left out
+    missing = [mid for mid in mids if mid not in attachments_by_matter]
+    if missing:
+        print(f"  Fetching attachments for {len(missing)} matters")
+        attachments_by_matter.update(zip(missing, executor.map(get_matter_attachments, missing)))
+
     matter_cache = {}  # matter_id -> {details, attachments}
-    for i, mid in enumerate(sorted(unique_matter_ids), 1):
-        print(f"  [{i}/{len(unique_matter_ids)}] Fetching matter {mid}...")
-        details = get_matter_details(mid)
-        attachments = get_matter_attachments(mid)
+    for mid in mids:
         matter_cache[mid] = {
-            'details': details,
-            'attachments': attachments,
+            'details': details_by_matter.get(mid),
+            'attachments': attachments_by_matter[mid],
         }
 
-    # Populate matter fields on each item
+    # Populate matter fields on each item, collecting the items Phase 2 will scrape
+    items_with_matter = []
+    populated = 0
     for item in all_items:
+        if item['matter_file']:
+            items_with_matter.append(item)
         mid = item.get('matter_id')
         if mid and mid in matter_cache:
             details = matter_cache[mid].get('details')
@@ -290,155 +622,150 @@ def main():
                 item['matter_enactment_number'] = details.get('MatterEnactmentNumber', '') or ''
                 item['matter_requester'] = details.get('MatterRequester', '') or ''
                 item['matter_body_name'] = details.get('MatterBodyName', '') or ''
+                if item['matter_title']:
+                    populated += 1
 
             attachments = matter_cache[mid].get('attachments', [])
             if attachments:
                 links = [a.get('MatterAttachmentHyperlink', '') for a in attachments if a.get('MatterAttachmentHyperlink')]
                 item['attachment_links'] = '|'.join(links)
 
-    print(f"Matter details populated for {sum(1 for i in all_items if i.get('matter_title'))} items")
+    print(f"Matter details populated for {populated} items")
 
-    # Phase 2: Scrape full text using Playwright
-    print("\n=== Phase 2: Scraping full legislative text via Playwright ===")
-    items_with_matter = [i for i in all_items if i['matter_file']]
+    # Phase 2: Scrape full text - plain HTTP first, Playwright only where that finds nothing
+    print("\n=== Phase 2: Scraping full legislative text ===")
     print(f"Items with matter files to scrape: {len(items_with_matter)}")
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-
-        # For each meeting, scrape the meeting page to get file-number-to-URL mapping
-        file_to_url_all = {}  # Global mapping across all meetings
-        processed_meetings = set()
-
-        for item in items_with_matter:
-            event_id = item['event_id']
-            if event_id not in processed_meetings:
-                insite_url = meeting_links[event_id]['insite_url']
-                if insite_url:
-                    print(f"\nScraping meeting page for EventId {event_id}...")
-                    file_to_url = scrape_legislation_urls(page, insite_url)
-                    file_to_url_all.update(file_to_url)
-                processed_meetings.add(event_id)
-
-        # Now extract full text for each agenda item
-        total = len(items_with_matter)
-        extracted = 0
-        skipped = 0
-        for i, item in enumerate(items_with_matter, 1):
-            matter_file = item['matter_file']
-            legislation_url = file_to_url_all.get(matter_file)
-
-            if not legislation_url:
-                skipped += 1
-                continue
-
-            print(f"  [{i}/{total}] Extracting text for {matter_file}...", end=" ")
-            full_text = extract_full_text(page, legislation_url)
-
-            if full_text:
-                item['Agenda_item_fulltext'] = full_text
-                extracted += 1
-                print(f"OK ({len(full_text)} chars)")
-            else:
-                print("No text found")
-
-            time.sleep(0.5)  # Rate limit between page loads
+    # Full text lives in fulltext_cache (on disk) and is read back one row at a time
+    # while writing the CSVs, so the texts are never all held in memory.
+    # Only items whose matter file has no stored text yet are scraped.
+    items_to_scrape = [i for i in items_with_matter if i['matter_file'] not in fulltext_cache]
+    print(f"Reusing stored text for {len(items_with_matter) - len(items_to_scrape)} items, "
+          f"{len(items_to_scrape)} to scrape")
+
+    # For each meeting, scrape the meeting page to get file-number-to-URL mapping (stored maps are reused)
+    event_ids = [e for e in dict.fromkeys(i['event_id'] for i in items_to_scrape)
+                 if meeting_links[e]['insite_url']]
+    urls_by_meeting = {e: url_map_cache[str(e)] for e in event_ids if str(e) in url_map_cache}
+    to_scrape = [e for e in event_ids if e not in urls_by_meeting]
+    insite_urls = [meeting_links[e]['insite_url'] for e in to_scrape]
+    urls_by_meeting.update(zip(to_scrape, executor.map(scrape_legislation_urls_http, insite_urls)))
+    for event_id in to_scrape:
+        print(f"  Scraped {len(urls_by_meeting[event_id])} legislation URLs for EventId {event_id}")
+
+    js_meetings = {e: meeting_links[e]['insite_url'] for e in to_scrape if not urls_by_meeting[e]}
+    if js_meetings:
+        urls_by_meeting.update(asyncio.run(scrape_meetings_playwright(js_meetings)))
+
+    for event_id in to_scrape:
+        if urls_by_meeting[event_id]:
+            url_map_cache[str(event_id)] = urls_by_meeting[event_id]
+    url_map_cache.sync()
+
+    file_to_url_all = {}  # Global mapping across all meetings, to the FullText=1 URLs
+    for event_id in event_ids:
+        file_to_url_all.update((f, with_fulltext(url)) for f, url in urls_by_meeting[event_id].items())
+
+    # Now extract full text for each agenda item over HTTP
+    total = len(items_to_scrape)
+    skipped = 0
+    jobs = []
+    for i, item in enumerate(items_to_scrape, 1):
+        legislation_url = file_to_url_all.get(item['matter_file'])
+        if legislation_url:
+            jobs.append((i, item, legislation_url))
+        else:
+            skipped += 1
+
+    extracted = 0
+    fallback_jobs = []  # pages without a server-rendered text div
+    texts = executor.map(extract_full_text_http, [url for _, _, url in jobs])
+    for (i, item, legislation_url), full_text in zip(jobs, texts):
+        if full_text is None:
+            fallback_jobs.append((i, item, legislation_url))
+        elif full_text:
+            fulltext_cache[item['matter_file']] = full_text
+            extracted += 1
+            print(f"  [{i}/{total}] {item['matter_file']}: OK ({len(full_text)} chars)")
+        else:
+            print(f"  [{i}/{total}] {item['matter_file']}: No text found")
 
-        browser.close()
+    # Fall back to Playwright for the rest
+    if fallback_jobs:
+        print(f"\nFalling back to Playwright for {len(fallback_jobs)} items...")
+        extracted += asyncio.run(scrape_full_text_playwright(fallback_jobs, total, fulltext_cache))
+    fulltext_cache.sync()
 
     print(f"\nFull text extraction complete: {extracted} extracted, {skipped} skipped (no URL)")
 
     # Sort members for consistent column order
-    members_list = sorted(list(all_members))
+    members_list = sorted(all_members)
     print(f"\nFound {len(members_list)} council members: {members_list}")
     print(f"Total agenda items: {len(all_items)}")
 
-    # Write CSV - all items
+    # Write CSVs - all items, plus a filtered version with only voted items
     output_file = '/Users/michaelingram/Documents/GitHub/CityVotes_Research/municipalities/Columbus-OH/Columbus-OH-Q1-2023-Votes.csv'
+    output_voted = '/Users/michaelingram/Documents/GitHub/CityVotes_Research/municipalities/Columbus-OH/Columbus-OH-Q1-2023-Voted-Items.csv'
 
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'event_id', 'event_date', 'event_time', 'event_location',
-            'event_item_id', 'agenda_number', 'agenda_sequence',
-            'matter_file', 'matter_name', 'matter_title', 'matter_type', 'matter_type_name',
-            'matter_status', 'matter_status_name',
-            'matter_intro_date', 'matter_passed_date', 'matter_enactment_date', 'matter_enactment_number',
-            'matter_requester', 'matter_body_name',
-            'title', 'action', 'action_text', 'passed', 'consent', 'tally', 'mover', 'seconder',
-            'roll_call_flag', 'agenda_link', 'minutes_link', 'video_link', 'attachment_links',
-            'Agenda_item_fulltext'
-        ] + members_list
-
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for item in all_items:
-            row = {k: item.get(k, '') for k in fieldnames if k not in members_list}
-
+    scalar_fields = [
+        'event_id', 'event_date', 'event_time', 'event_location',
+        'event_item_id', 'agenda_number', 'agenda_sequence',
+        'matter_file', 'matter_name', 'matter_title', 'matter_type', 'matter_type_name',
+        'matter_status', 'matter_status_name',
+        'matter_intro_date', 'matter_passed_date', 'matter_enactment_date', 'matter_enactment_number',
+        'matter_requester', 'matter_body_name',
+        'title', 'action', 'action_text', 'passed', 'consent', 'tally', 'mover', 'seconder',
+        'roll_call_flag', 'agenda_link', 'minutes_link', 'video_link', 'attachment_links',
+        'Agenda_item_fulltext'
+    ]
+    fieldnames = scalar_fields + members_list
+    meeting_fields = ('event_date', 'event_time', 'event_location', 'agenda_link', 'minutes_link', 'video_link')
+    # (field, comes from the meeting) for each scalar column but the last, Agenda_item_fulltext
+    columns = [(f, f in meeting_fields) for f in scalar_fields[:-1]]
+
+    # Member vote columns depend only on the meeting's attendance and whether the
+    # item passed, so they are computed once per meeting rather than once per item
+    no_votes = [''] * len(members_list)
+    passed_votes_by_meeting = {}
+
+    def build_row(item):
+        """CSV row for an item, in fieldnames order: scalar fields plus one vote column per member"""
+        meeting = item['meeting']
+        row = [meeting[f] if from_meeting else item[f] for f, from_meeting in columns]
+        row.append(fulltext_cache.get(item['matter_file'], '') if item['matter_file'] else '')
+        if item['passed'] == 1:
             # For items that passed, record as unanimous affirmative vote
-            if item['passed'] == 1:
-                for member in members_list:
-                    attendance_status = item['attendance'].get(member, '')
-                    if attendance_status == 'Present':
-                        row[member] = 'Yes'
-                    elif attendance_status in ['Absent', 'Absent@vote']:
-                        row[member] = 'Absent'
-                    else:
-                        row[member] = 'Yes'  # Default to affirmative for unanimous
-            elif item['passed'] == 0:
-                # Item failed - rare, would need specific vote data
-                for member in members_list:
-                    row[member] = ''
-            else:
-                # No vote taken
-                for member in members_list:
-                    row[member] = ''
+            votes = passed_votes_by_meeting.get(item['event_id'])
+            if votes is None:
+                attendance = meeting['attendance']
+                votes = passed_votes_by_meeting[item['event_id']] = [
+                    'Absent' if attendance.get(member, '') in ('Absent', 'Absent@vote') else 'Yes'
+                    for member in members_list
+                ]
+            row.extend(votes)
+        else:
+            # Item failed (rare, would need specific vote data) or no vote taken
+            row.extend(no_votes)
+        return row
+
+    voted_count = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as f_all, \
+            open(output_voted, 'w', newline='', encoding='utf-8') as f_voted:
+        writer_all = csv.writer(f_all)
+        writer_voted = csv.writer(f_voted)
+        writer_all.writerow(fieldnames)
+        writer_voted.writerow(fieldnames)
 
-            writer.writerow(row)
+        for item in all_items:
+            row = build_row(item)
+            writer_all.writerow(row)
+            if item['passed'] is not None:
+                writer_voted.writerow(row)
+                voted_count += 1
 
     print(f"\nCSV written to: {output_file}")
-
-    # Also write a filtered version with only voted items
-    voted_items = [i for i in all_items if i['passed'] is not None]
-    output_voted = '/Users/michaelingram/Documents/GitHub/CityVotes_Research/municipalities/Columbus-OH/Columbus-OH-Q1-2023-Voted-Items.csv'
-
-    with open(output_voted, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'event_id', 'event_date', 'event_time', 'event_location',
-            'event_item_id', 'agenda_number', 'agenda_sequence',
-            'matter_file', 'matter_name', 'matter_title', 'matter_type', 'matter_type_name',
-            'matter_status', 'matter_status_name',
-            'matter_intro_date', 'matter_passed_date', 'matter_enactment_date', 'matter_enactment_number',
-            'matter_requester', 'matter_body_name',
-            'title', 'action', 'action_text', 'passed', 'consent', 'tally', 'mover', 'seconder',
-            'roll_call_flag', 'agenda_link', 'minutes_link', 'video_link', 'attachment_links',
-            'Agenda_item_fulltext'
-        ] + members_list
-
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for item in voted_items:
-            row = {k: item.get(k, '') for k in fieldnames if k not in members_list}
-
-            if item['passed'] == 1:
-                for member in members_list:
-                    attendance_status = item['attendance'].get(member, '')
-                    if attendance_status == 'Present':
-                        row[member] = 'Yes'
-                    elif attendance_status in ['Absent', 'Absent@vote']:
-                        row[member] = 'Absent'
-                    else:
-                        row[member] = 'Yes'  # Default to affirmative for unanimous
-            else:
-                for member in members_list:
-                    row[member] = ''
-
-            writer.writerow(row)
-
     print(f"Voted items CSV: {output_voted}")
-    print(f"Total voted items: {len(voted_items)}")
+    print(f"Total voted items: {voted_count}")
 
     # Write Persons CSV
     output_persons = '/Users/michaelingram/Documents/GitHub/CityVotes_Research/municipalities/Columbus-OH/Columbus-OH-Q1-2023-Persons.csv'
@@ -0,0 +1,233 @@
+"""
+HTML parsing for server-rendered Legistar web pages (stdlib only).
+
+DivTextParser follows the browser's innerText rules for a <div>, so text
+read over plain HTTP matches what Playwright's inner_text() returns for the
+same page.
+"""
+
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+class LegislationLinkParser(HTMLParser):
+    """Collect {link text: href} for LegislationDetail links in a meeting page"""
+
+    def __init__(self, base_url):
+        super().__init__()
+        self.base_url = base_url
+        self.file_to_url = {}
+        self.href = None
+        self.text = []
+
+    def handle_starttag(self, tag, attrs):
+        href = dict(attrs).get('href') or ''
+        if tag == 'a' and 'LegislationDetail' in href:
+            self.href = urljoin(self.base_url, href)
+            self.text = []
+
+    def handle_data(self, data):
+        if self.href:
+            self.text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self.href:
+            file_number = ''.join(self.text).strip()
+            if file_number:
+                self.file_to_url[file_number] = self.href
+            self.href = None
+
+class DivTextParser(HTMLParser):
+    """
+    Collect the text of the <div> with a given id the way innerText renders it:
+    - block elements start and end a line (<p> leaves a blank line)
+    - table cells are separated by tabs, table rows by newlines
+    - <br> is a newline, <pre> keeps its whitespace, other whitespace collapses
+    - <script>, <style>, <noscript> and <template> contents are skipped
+    Where the div and each element in it end follows the browser's tree
+    building: implied end tags (a block start closes an open <p>, an <li> or
+    <td> its open sibling) and end tags that close everything still open inside.
+    test_legistar_html checks this against Chromium where it is installed.
+    """
+
+    BLOCK_TAGS = {
+        'address', 'article', 'aside', 'blockquote', 'caption', 'center', 'dd', 'details',
+        'dialog', 'dir', 'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure', 'footer',
+        'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'legend', 'li', 'main',
+        'menu', 'nav', 'ol', 'pre', 'section', 'summary', 'table', 'ul',
+    }
+    HIDDEN_TAGS = {'script', 'style', 'noscript', 'template'}
+    VOID_TAGS = {
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+        'param', 'source', 'track', 'wbr',
+    }
+    # Elements an end tag can't reach past (the HTML spec's "scope" boundaries)
+    SCOPE_TAGS = {'applet', 'caption', 'html', 'marquee', 'object', 'table', 'td', 'th', 'template'}
+    TABLE_SCOPE_TAGS = {'html', 'table', 'template'}
+    TABLE_PART_TAGS = {'caption', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'tr'}
+    # Structural elements an inline end tag (</b>, </span>...) can't close
+    SPECIAL_TAGS = BLOCK_TAGS | SCOPE_TAGS | TABLE_PART_TAGS | {'body', 'button', 'p'}
+    # Start tag -> (open elements it implicitly closes, boundaries of that search)
+    IMPLIED_END_TAGS = {
+        'li': ({'li'}, SCOPE_TAGS | {'ol', 'ul'}),
+        'dt': ({'dt', 'dd'}, SCOPE_TAGS),
+        'dd': ({'dt', 'dd'}, SCOPE_TAGS),
+        'tr': ({'tr', 'td', 'th'}, TABLE_SCOPE_TAGS),
+        'td': ({'td', 'th'}, TABLE_SCOPE_TAGS | {'tr'}),
+        'th': ({'td', 'th'}, TABLE_SCOPE_TAGS | {'tr'}),
+        'tbody': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, TABLE_SCOPE_TAGS),
+        'thead': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, TABLE_SCOPE_TAGS),
+        'tfoot': ({'tbody', 'thead', 'tfoot', 'tr', 'td', 'th'}, TABLE_SCOPE_TAGS),
+    }
+    WHITESPACE_RE = re.compile(r'[ \t\n\r\f]+')
+
+    def __init__(self, div_id):
+        super().__init__()
+        self.div_id = div_id
+        self.found = False
+        self.open = []  # open elements of the whole document, outermost first
+        self.target = None  # index of the target div in self.open while it is open
+        self.hidden = 0  # open hidden elements inside the target
+        self.pre = 0  # open <pre>s inside the target
+        self.tables = []  # per open table: [rows seen, cells seen in the current row]
+        # Rendered pieces: ('text', collapsible str), ('raw', literal str),
+        # or an int - a required line break count, as in the innerText algorithm
+        self.items = []
+
+    def _breaks(self, tag):
+        if tag == 'p':
+            self.items.append(2)
+        elif tag in self.BLOCK_TAGS:
+            self.items.append(1)
+
+    def _find_open(self, tags, boundaries):
+        """Index of the innermost open element in tags, unless a boundary element comes first"""
+        for i in range(len(self.open) - 1, -1, -1):
+            if self.open[i] in tags:
+                return i
+            if self.open[i] in boundaries:
+                return None
+        return None
+
+    def _close_from(self, index):
+        """Close the element at index and every element still open inside it"""
+        while len(self.open) > index:
+            tag = self.open.pop()
+            if self.target is None:
+                continue
+            if len(self.open) == self.target:
+                self.target = None
+            elif tag in self.HIDDEN_TAGS:
+                self.hidden -= 1
+            elif not self.hidden:
+                self._breaks(tag)
+                if tag == 'pre':
+                    self.pre -= 1
+                elif tag == 'table':
+                    self.tables.pop()
+
+    def handle_starttag(self, tag, attrs):
+        # A block start closes an open <p>; list items, terms and table parts close their open siblings
+        if tag == 'p' or tag in self.BLOCK_TAGS:
+            index = self._find_open({'p'}, self.SCOPE_TAGS | {'button'})
+            if index is not None:
+                self._close_from(index)
+        if tag in self.IMPLIED_END_TAGS:
+            index = self._find_open(*self.IMPLIED_END_TAGS[tag])
+            if index is not None:
+                self._close_from(index)
+        if tag not in self.VOID_TAGS:
+            self.open.append(tag)
+
+        if self.target is None:
+            if tag == 'div' and not self.found and dict(attrs).get('id') == self.div_id:
+                self.found = True
+                self.target = len(self.open) - 1
+            return
+        if tag in self.HIDDEN_TAGS:
+            self.hidden += 1
+        if self.hidden:
+            return
+
+        self._breaks(tag)
+        if tag == 'pre':
+            self.pre += 1
+        elif tag == 'br':
+            self.items.append(('raw', '\n'))
+        elif tag == 'table':
+            self.tables.append([0, 0])
+        elif tag == 'tr' and self.tables:
+            table = self.tables[-1]
+            if table[0]:
+                self.items.append(('raw', '\n'))
+            table[0] += 1
+            table[1] = 0
+        elif tag in ('td', 'th') and self.tables:
+            table = self.tables[-1]
+            if table[1]:
+                self.items.append(('raw', '\t'))
+            table[1] += 1
+
+    def handle_startendtag(self, tag, attrs):
+        # HTML ignores the self-closing slash: <br/> is void anyway, <div/> still opens a div
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in self.TABLE_PART_TAGS:
+            boundaries = self.TABLE_SCOPE_TAGS
+        elif tag in self.SPECIAL_TAGS:
+            boundaries = self.SCOPE_TAGS | ({'button'} if tag == 'p' else set())
+        else:
+            boundaries = self.SPECIAL_TAGS
+        index = self._find_open({tag}, boundaries)
+        if index is not None:
+            self._close_from(index)
+        elif tag == 'p' and self.target is not None and not self.hidden:
+            # A stray </p> renders as an empty paragraph
+            self._breaks('p')
+
+    def handle_data(self, data):
+        if self.target is not None and not self.hidden:
+            self.items.append(('raw' if self.pre else 'text', data))
+
+    def text(self):
+        out = []
+        breaks = 0  # pending required line breaks
+        space = False  # pending collapsed space
+        line_start = True
+
+        def emit(s):
+            nonlocal breaks, space, line_start
+            if breaks and out:
+                out.append('\n' * breaks)
+            elif space and not line_start:
+                out.append(' ')
+            out.append(s)
+            breaks = 0
+            space = False
+            line_start = s.endswith(('\n', '\t'))
+
+        for item in self.items:
+            if isinstance(item, int):
+                breaks = max(breaks, item)
+                space = False
+                continue
+            kind, s = item
+            if kind == 'raw':
+                # Spaces before a line break or cell boundary aren't rendered
+                space = False
+                emit(s)
+                continue
+            s = self.WHITESPACE_RE.sub(' ', s)
+            if s.startswith(' '):
+                if not (breaks or line_start):
+                    space = True
+                s = s[1:]
+            trailing = s.endswith(' ')
+            s = s.rstrip(' ')
+            if s:
+                emit(s)
+            if trailing and not breaks:
+                space = True
+
+        return ''.join(out).strip()
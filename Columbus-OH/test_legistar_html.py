@@ -0,0 +1,119 @@
+"""
+Fixture tests for legistar_html.DivTextParser: the HTTP full-text path must
+produce the same text as Playwright's inner_text() on the same HTML.
+
+Run from this directory:
+    python -m unittest test_legistar_html
+The browser comparison is skipped unless Playwright and Chromium are installed.
+"""
+
+import unittest
+
+from legistar_html import DivTextParser
+
+DIV_ID = 'ctl00_ContentPlaceHolder1_divText'
+
+# The text div sits in a layout cell, with more of the page after it
+PAGE = (
+    '<html><body><table><tr><td><div id="' + DIV_ID + '">{inner_html}</div></td></tr></table>'
+    '<div>Footer</div></body></html>'
+)
+
+# (name, inner HTML of the text div, expected innerText)
+FIXTURES = [
+    (
+        'table',
+        '<table><tr><td>Fund</td><td>Amount</td></tr><tr><td>General</td><td>$5,000</td></tr></table>',
+        'Fund\tAmount\nGeneral\t$5,000',
+    ),
+    (
+        'formatted_table',
+        '<p>To appropriate:</p>\n<table>\n <tbody>\n  <tr>\n   <th> Fund </th>\n   <th>Amount</th>\n  </tr>\n'
+        '  <tr>\n   <td>General</td>\n   <td>$5,000</td>\n  </tr>\n </tbody>\n</table>\n<p>Total</p>',
+        'To appropriate:\n\nFund\tAmount\nGeneral\t$5,000\n\nTotal',
+    ),
+    (
+        'script_and_style',
+        '<p>Section 1.</p><script>var x=1;</script><style>.c{color:red}</style><p>Section 2.</p>',
+        'Section 1.\n\nSection 2.',
+    ),
+    (
+        'sibling_divs',
+        '<div>WHEREAS, one;</div>\n<div>WHEREAS, two;</div>',
+        'WHEREAS, one;\nWHEREAS, two;',
+    ),
+    (
+        'paragraphs_and_breaks',
+        '<p>BE IT ORDAINED <b>by the</b>  Council:</p><p>Line one<br>Line two</p>',
+        'BE IT ORDAINED by the Council:\n\nLine one\nLine two',
+    ),
+    (
+        # The browser closes the inner div at </td>, so the footer stays out
+        'unclosed_div',
+        '<div>open<p>x</p>',
+        'open\n\nx',
+    ),
+    (
+        'implied_paragraph_end',
+        '<p>One<p>Two<div>Three</div>',
+        'One\n\nTwo\n\nThree',
+    ),
+    (
+        'implied_cell_and_item_ends',
+        '<ul><li>First<li>Second</ul><table><tr><td>A<td>B<tr><td>C</table>',
+        'First\nSecond\nA\tB\nC',
+    ),
+]
+
+def http_text(inner_html):
+    parser = DivTextParser(DIV_ID)
+    parser.feed(PAGE.format(inner_html=inner_html))
+    return parser.text()
+
+class DivTextParserTest(unittest.TestCase):
+
+    def test_fixtures(self):
+        for name, inner_html, expected in FIXTURES:
+            with self.subTest(name):
+                self.assertEqual(http_text(inner_html), expected)
+
+    def test_first_matching_div(self):
+        parser = DivTextParser(DIV_ID)
+        parser.feed(f'<div id="{DIV_ID}">one</div><div id="{DIV_ID}">two</div>')
+        self.assertEqual(parser.text(), 'one')
+
+    def test_missing_div(self):
+        parser = DivTextParser(DIV_ID)
+        parser.feed('<html><body><div id="other">text</div></body></html>')
+        self.assertFalse(parser.found)
+
+class PlaywrightParityTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            from playwright.sync_api import sync_playwright
+            cls.playwright = sync_playwright().start()
+        except Exception as e:
+            raise unittest.SkipTest(f"Playwright not available: {e}")
+        try:
+            cls.browser = cls.playwright.chromium.launch(headless=True)
+        except Exception as e:
+            cls.playwright.stop()
+            raise unittest.SkipTest(f"Chromium not available: {e}")
+        cls.page = cls.browser.new_page()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.browser.close()
+        cls.playwright.stop()
+
+    def test_matches_inner_text(self):
+        for name, inner_html, _ in FIXTURES:
+            with self.subTest(name):
+                self.page.set_content(PAGE.format(inner_html=inner_html))
+                browser_text = self.page.inner_text(f'#{DIV_ID}').strip()
+                self.assertEqual(http_text(inner_html), browser_text)
+
+if __name__ == '__main__':
+    unittest.main()